@@ -9,13 +9,14 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
+from .const import DATA_MATCH_INDEX, DOMAIN
 from .coordinator import RocketLeagueCoordinator
+from .match_index import MatchIndex
 from .services import async_setup_services, async_unload_services
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.SENSOR]
+PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.EVENT]
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -30,6 +31,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up Rocket League Assistant entry: %s", entry.title)
     _LOGGER.debug("Entry data: %s", {k: v for k, v in entry.data.items() if k != "uuid"})  # Don't log UUID
     
+    # Shared across all players so teammates' payloads form one match record.
+    # Entries are set up concurrently, so store the index before awaiting its load
+    if (match_index := hass.data.get(DATA_MATCH_INDEX)) is None:
+        match_index = hass.data[DATA_MATCH_INDEX] = MatchIndex(hass)
+    await match_index.async_load()
+    
     coordinator = RocketLeagueCoordinator(hass, entry)
     
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -42,6 +49,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     else:
         _LOGGER.debug("Additional entry, services already set up. Total entries: %d", len(hass.data[DOMAIN]))
     
+    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    
     _LOGGER.debug("Setting up platforms: %s", PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
@@ -49,6 +58,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    coordinator: RocketLeagueCoordinator = hass.data[DOMAIN][entry.entry_id]
+    
+    # Updates to entry.data (e.g. migrating stored match data) also trigger this listener
+    if dict(entry.options) == coordinator.options:
+        return
+    
+    _LOGGER.debug("Options changed for %s, reloading entry", entry.title)
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     _LOGGER.info("Unloading Rocket League Assistant entry: %s", entry.title)
@@ -61,9 +82,23 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if not hass.data[DOMAIN]:
             _LOGGER.debug("Last entry removed, unloading services")
             await async_unload_services(hass)
+            await hass.data.pop(DATA_MATCH_INDEX).async_unload()
         else:
             _LOGGER.debug("Other entries remain, keeping services. Remaining entries: %d", len(hass.data[DOMAIN]))
     else:
         _LOGGER.error("Failed to unload platforms for entry: %s", entry.title)
     
-    return unload_ok
\ No newline at end of file
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove a player's stored state when its entry is deleted."""
+    if (match_index := hass.data.get(DATA_MATCH_INDEX)) is not None:
+        match_index.async_remove_player(entry.entry_id)
+        return
+    
+    # The last entry was already unloaded along with the index
+    match_index = MatchIndex(hass)
+    await match_index.async_load()
+    match_index.async_remove_player(entry.entry_id)
+    await match_index.async_unload()
@@ -8,11 +8,22 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import CONF_USERNAME, CONF_PLATFORM, CONF_UUID, DEFAULT_NAME, DOMAIN, PLATFORMS_LIST
+from .const import (
+    CONF_HISTORY_SIZE,
+    CONF_MEMORY_BUDGET,
+    CONF_USERNAME,
+    CONF_PLATFORM,
+    CONF_UUID,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_MEMORY_BUDGET,
+    DEFAULT_NAME,
+    DOMAIN,
+    PLATFORMS_LIST,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,6 +80,43 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle options for Rocket League Assistant."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            _LOGGER.debug("Updating options for %s: %s", self.config_entry.title, user_input)
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MEMORY_BUDGET,
+                        default=options.get(CONF_MEMORY_BUDGET, DEFAULT_MEMORY_BUDGET),
+                    ): bool,
+                    vol.Required(
+                        CONF_HISTORY_SIZE,
+                        default=options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=500)),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -8,13 +8,67 @@ CONF_WEBHOOK_ID = "webhook_id"
 CONF_PLATFORM = "platform"
 CONF_UUID = "uuid"
 
+# Option constants
+CONF_MEMORY_BUDGET = "memory_budget"
+CONF_HISTORY_SIZE = "history_size"
+
 # Platform constants
 PLATFORM_STEAM = "steam"
 PLATFORM_EPIC = "epic"
 PLATFORMS_LIST = [PLATFORM_STEAM, PLATFORM_EPIC]
 
+# Payload flag marking a partial update to merge into the current state
+PAYLOAD_DELTA = "delta"
+
+# Plugin event types sent in the webhook "data" field
+PLUGIN_EVENT_MATCH_STARTED = "matchStarted"
+PLUGIN_EVENT_GOAL_SCORED = "goalScored"
+PLUGIN_EVENT_MATCH_ENDED = "matchEnded"
+
+# Event entity types
+EVENT_TYPE_MATCH_STARTED = "match_started"
+EVENT_TYPE_GOAL = "goal"
+EVENT_TYPE_MATCH_ENDED = "match_ended"
+EVENT_TYPES = [EVENT_TYPE_MATCH_STARTED, EVENT_TYPE_GOAL, EVENT_TYPE_MATCH_ENDED]
+
+# Plugin event type -> event entity type
+PLUGIN_EVENTS = {
+    PLUGIN_EVENT_MATCH_STARTED: EVENT_TYPE_MATCH_STARTED,
+    PLUGIN_EVENT_GOAL_SCORED: EVENT_TYPE_GOAL,
+    PLUGIN_EVENT_MATCH_ENDED: EVENT_TYPE_MATCH_ENDED,
+}
+
+# Home Assistant bus events fired for each event type
+EVENT_MATCH_STARTED = f"{DOMAIN}_{EVENT_TYPE_MATCH_STARTED}"
+EVENT_GOAL = f"{DOMAIN}_{EVENT_TYPE_GOAL}"
+EVENT_MATCH_ENDED = f"{DOMAIN}_{EVENT_TYPE_MATCH_ENDED}"
+BUS_EVENTS = {
+    EVENT_TYPE_MATCH_STARTED: EVENT_MATCH_STARTED,
+    EVENT_TYPE_GOAL: EVENT_GOAL,
+    EVENT_TYPE_MATCH_ENDED: EVENT_MATCH_ENDED,
+}
+
+# Dispatcher signal for event entities, formatted with the config entry ID
+SIGNAL_MATCH_EVENT = f"{DOMAIN}_match_event_{{}}"
+
+# Dispatcher signal for party stat updates, formatted with the config entry ID
+SIGNAL_PARTY_UPDATE = f"{DOMAIN}_party_update_{{}}"
+
+# Shared match index, kept in hass.data next to the coordinators
+DATA_MATCH_INDEX = f"{DOMAIN}_match_index"
+# Seconds within which payloads with the same playlist, scores and colors are one match
+CORRELATION_WINDOW = 60
+MATCH_RECORD_LIMIT = 100
+
+# Match results
+RESULT_WIN = "Win"
+RESULT_LOSS = "Loss"
+RESULT_TIE = "Tie"
+
 # Default values
 DEFAULT_NAME = "Rocket League Assistant"
+DEFAULT_MEMORY_BUDGET = False
+DEFAULT_HISTORY_SIZE = 20
 
 # Rocket League playlists
 PLAYLISTS = {
@@ -28,6 +82,12 @@ PLAYLISTS = {
     "Tournaments": "Tournaments"
 }
 
+# Fields kept per payload section in memory budget mode
+TEAM_FIELDS = ("score", "color")
+PLAYER_DATA_FIELDS = ("name", "uid")
+RANK_FIELDS = ("mmr", "tier", "division", "matches_played", "rank_name", "is_synced")
+CURRENT_PLAYLIST_FIELDS = ("id", "name") + RANK_FIELDS
+
 # Rank tiers mapping
 RANK_TIERS = {
     0: "Unranked",
@@ -2,18 +2,201 @@
 from __future__ import annotations
 
 import logging
+import sys
+from collections import deque
 from datetime import timedelta
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 
-from .const import CONF_USERNAME, CONF_PLATFORM, CONF_UUID, DOMAIN, PLATFORM_STEAM, PLATFORM_EPIC
+from .const import (
+    BUS_EVENTS,
+    CONF_HISTORY_SIZE,
+    CONF_MEMORY_BUDGET,
+    CONF_USERNAME,
+    CONF_PLATFORM,
+    CONF_UUID,
+    CURRENT_PLAYLIST_FIELDS,
+    DATA_MATCH_INDEX,
+    DEFAULT_HISTORY_SIZE,
+    DEFAULT_MEMORY_BUDGET,
+    DOMAIN,
+    EVENT_TYPE_GOAL,
+    EVENT_TYPE_MATCH_ENDED,
+    PAYLOAD_DELTA,
+    PLATFORM_STEAM,
+    PLATFORM_EPIC,
+    PLAYER_DATA_FIELDS,
+    PLAYLISTS,
+    PLUGIN_EVENTS,
+    RANK_FIELDS,
+    RESULT_LOSS,
+    RESULT_TIE,
+    RESULT_WIN,
+    SIGNAL_MATCH_EVENT,
+    TEAM_FIELDS,
+)
+from .match_index import MatchIndex
 
 _LOGGER = logging.getLogger(__name__)
 
+FieldPath = tuple[str, ...]
+
+
+def _merge_delta(
+    current: dict[str, Any], delta: dict[str, Any], prefix: FieldPath = ()
+) -> tuple[dict[str, Any], list[FieldPath]]:
+    """Deep-merge a partial payload into the current state.
+
+    A ``None`` value deletes that key. Returns a new dict that shares every
+    untouched branch with ``current``, along with the paths that changed.
+    """
+    merged = dict(current)
+    changed: list[FieldPath] = []
+    for key, value in delta.items():
+        path = prefix + (key,)
+        existing = current.get(key)
+        if value is None:
+            if key in current:
+                del merged[key]
+                changed.append(path)
+        elif isinstance(value, dict) and isinstance(existing, dict):
+            merged_value, sub_changed = _merge_delta(existing, value, path)
+            if sub_changed:
+                merged[key] = merged_value
+                changed.extend(sub_changed)
+        elif key not in current or existing != value:
+            merged[key] = value
+            changed.append(path)
+    return merged, changed
+
+
+def _drop_nulls(data: dict[str, Any]) -> dict[str, Any]:
+    """Remove ``None`` values from a full payload so missing sections read as empty."""
+    return {
+        key: _drop_nulls(value) if isinstance(value, dict) else value
+        for key, value in data.items()
+        if value is not None
+    }
+
+
+def _diff_paths(
+    old: dict[str, Any], new: dict[str, Any], prefix: FieldPath = ()
+) -> list[FieldPath]:
+    """Get the paths that differ between two full payloads."""
+    changed: list[FieldPath] = []
+    for key in old.keys() | new.keys():
+        path = prefix + (key,)
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            changed.extend(_diff_paths(old_value, new_value, path))
+        elif key not in old or key not in new or old_value != new_value:
+            changed.append(path)
+    return changed
+
+
+class FieldVersions:
+    """Track the data version in which each field path last changed.
+
+    ``changed`` holds the exact paths a payload changed. ``touched`` holds those
+    paths and every prefix of them, so a field can see changes below it. A
+    field counts as changed when it was touched, or when one of its strict
+    ancestors was itself changed (e.g. the whole ``ranks`` section dropped).
+    Siblings never affect each other.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.version = 0
+        self.changed: dict[FieldPath, int] = {}
+        self.touched: dict[FieldPath, int] = {}
+
+    def record(self, paths: list[FieldPath]) -> None:
+        """Bump the version and stamp it on the given changed paths."""
+        self.version += 1
+        for path in paths:
+            self.changed[path] = self.version
+            for end in range(1, len(path) + 1):
+                self.touched[path[:end]] = self.version
+
+    def changed_since(self, fields: tuple[FieldPath, ...], version: int) -> bool:
+        """Check whether any of the given field paths changed after a version."""
+        return any(
+            self.touched.get(path, 0) > version
+            or any(self.changed.get(path[:end], 0) > version for end in range(1, len(path)))
+            for path in fields
+        )
+
+
+def _intern(value: Any) -> Any:
+    """Intern strings so repeated names share one object across players."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _pick(section: Any, fields: tuple[str, ...]) -> dict[str, Any]:
+    """Keep only the given fields of a payload section, interning strings."""
+    if not isinstance(section, dict):
+        return {}
+    return {field: _intern(section[field]) for field in fields if field in section}
+
+
+def _normalize_match_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Strip a (full or partial) payload down to the fields the entities use.
+
+    Only sections present in ``data`` are kept, so deltas stay partial.
+    """
+    normalized: dict[str, Any] = {}
+    if "data" in data:
+        normalized["data"] = _intern(data["data"])
+    
+    if isinstance(team_data := data.get("TeamData"), dict):
+        normalized["TeamData"] = {
+            team: _pick(team_data[team], TEAM_FIELDS)
+            for team in ("PlayersTeam", "OtherTeam")
+            if team in team_data
+        }
+    
+    if isinstance(mmr_data := data.get("MMRData"), dict):
+        normalized_mmr: dict[str, Any] = {}
+        if "player_data" in mmr_data:
+            normalized_mmr["player_data"] = _pick(mmr_data["player_data"], PLAYER_DATA_FIELDS)
+        if "current_playlist" in mmr_data:
+            normalized_mmr["current_playlist"] = _pick(mmr_data["current_playlist"], CURRENT_PLAYLIST_FIELDS)
+        if isinstance(ranks := mmr_data.get("ranks"), dict):
+            normalized_mmr["ranks"] = {
+                _intern(playlist): _pick(rank, RANK_FIELDS)
+                for playlist, rank in ranks.items()
+                if playlist in PLAYLISTS
+            }
+        normalized["MMRData"] = normalized_mmr
+    
+    return normalized
+
+
+def _deep_getsizeof(value: Any, seen: set[int] | None = None) -> int:
+    """Approximate the memory used by a nested structure, counting shared objects once."""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(
+            _deep_getsizeof(key, seen) + _deep_getsizeof(item, seen)
+            for key, item in value.items()
+        )
+    elif isinstance(value, (list, tuple, set, deque)):
+        size += sum(_deep_getsizeof(item, seen) for item in value)
+    return size
+
 
 class RocketLeagueCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Rocket League data."""
@@ -25,18 +208,42 @@ class RocketLeagueCoordinator(DataUpdateCoordinator):
         self.uuid = entry.data[CONF_UUID]
         self.entry = entry
         self.hass = hass
+        self.options = dict(entry.options)
+        self.memory_budget = entry.options.get(CONF_MEMORY_BUDGET, DEFAULT_MEMORY_BUDGET)
+        
+        self._match_index: MatchIndex = hass.data[DATA_MATCH_INDEX]
         
-        # Try to restore last match data from entry data
-        self._last_match_data: dict[str, Any] = entry.data.get("last_match_data", {})
+        # Try to restore last match data from the shared store, moving over any
+        # copy that older versions kept in entry.data
+        stored = self._match_index.player_state.get(entry.entry_id)
+        if stored is None and "last_match_data" in entry.data:
+            stored = self._migrate_match_data_from_entry()
+        self._last_match_data: dict[str, Any] = _drop_nulls(stored or {})
+        if self.memory_budget:
+            normalized = _normalize_match_data(self._last_match_data)
+            if normalized != self._last_match_data:
+                # Replace the raw copy in the store too, so it isn't kept twice
+                self._last_match_data = normalized
+                self._save_match_data(normalized)
+        
+        # Summaries of recently ended matches, oldest first. Kept in memory
+        # only, so it starts empty after a restart or options change
+        self.match_history: deque[dict[str, Any]] = deque(
+            maxlen=entry.options.get(CONF_HISTORY_SIZE, DEFAULT_HISTORY_SIZE)
+        )
+        self._last_match_id: str | None = None
         
         _LOGGER.debug("Initializing RocketLeagueCoordinator for user: %s, platform: %s, UUID: %s", 
                      self.username, self.platform, self.uuid)
         
         if self._last_match_data:
-            _LOGGER.debug("Restored previous match data from config entry")
+            _LOGGER.debug("Restored previous match data from storage")
         else:
             _LOGGER.debug("No previous match data found, starting with empty state")
         
+        # Bumped on every accepted payload; remembers the version each field changed in
+        self._field_versions = FieldVersions()
+        
         super().__init__(
             hass,
             _LOGGER,
@@ -95,7 +302,7 @@ class RocketLeagueCoordinator(DataUpdateCoordinator):
                      self.username, self.platform, self.uuid)
         _LOGGER.debug("Webhook data keys: %s", list(webhook_data.keys()) if webhook_data else "None")
         
-        player_data = webhook_data.get("MMRData", {}).get("player_data", {})
+        player_data = (webhook_data.get("MMRData") or {}).get("player_data") or {}
         received_uid = player_data.get("uid", "")
         
         _LOGGER.debug("Player data from webhook: %s", player_data)
@@ -107,19 +314,41 @@ class RocketLeagueCoordinator(DataUpdateCoordinator):
         _LOGGER.debug("Expected UUID: %s", self.uuid)
         
         if received_uuid == self.uuid:
-            self._last_match_data = webhook_data
+            previous_data = self._last_match_data
+            payload = {key: value for key, value in webhook_data.items() if key != PAYLOAD_DELTA}
             
-            # Save the data to config entry for persistence across reloads
-            self._save_match_data_to_entry(webhook_data)
+            if webhook_data.get(PAYLOAD_DELTA):
+                match_data, changed = _merge_delta(previous_data, payload)
+                if self.memory_budget:
+                    match_data = _normalize_match_data(match_data)
+                    changed = _diff_paths(previous_data, match_data)
+                _LOGGER.debug("Merged delta payload, changed fields: %s", changed)
+            else:
+                match_data = _drop_nulls(payload)
+                if self.memory_budget:
+                    match_data = _normalize_match_data(match_data)
+                changed = _diff_paths(previous_data, match_data)
+                _LOGGER.debug("Full payload, changed fields: %s", changed)
             
-            self.async_set_updated_data(webhook_data)
-            _LOGGER.info(
-                "✅ Updated match data for %s user %s (UUID: %s)", 
-                self.platform.title(), 
-                self.username, 
-                self.uuid
-            )
-            _LOGGER.debug("Match data updated with: %s", webhook_data)
+            if changed:
+                self._last_match_data = match_data
+                self._record_changed_fields(changed)
+                
+                # Save the data for persistence across reloads
+                self._save_match_data(match_data)
+                
+                self.async_set_updated_data(match_data)
+                _LOGGER.info(
+                    "✅ Updated match data for %s user %s (UUID: %s)", 
+                    self.platform.title(), 
+                    self.username, 
+                    self.uuid
+                )
+                _LOGGER.debug("Match data updated with: %s", match_data)
+            else:
+                _LOGGER.debug("Payload for %s changed nothing, skipping update", self.username)
+            
+            self._fire_match_event(webhook_data.get("data"), match_data, previous_data)
         else:
             _LOGGER.debug(
                 "❌ Webhook data UUID mismatch for %s user %s. Expected UUID: %s, received UID: %s (extracted UUID: %s)",
@@ -130,21 +359,167 @@ class RocketLeagueCoordinator(DataUpdateCoordinator):
                 received_uuid
             )
 
-    def _save_match_data_to_entry(self, webhook_data: dict[str, Any]) -> None:
-        """Save match data to config entry for persistence."""
-        try:
-            # Create new data dict with the last match data
-            new_data = dict(self.entry.data)
-            new_data["last_match_data"] = webhook_data
-            
-            # Update the config entry
-            self.hass.config_entries.async_update_entry(
-                self.entry, 
-                data=new_data
+    @property
+    def data_version(self) -> int:
+        """Version of the last payload that changed anything."""
+        return self._field_versions.version
+
+    def _record_changed_fields(self, changed: list[FieldPath]) -> None:
+        """Bump the data version and stamp it on the changed paths."""
+        self._field_versions.record(changed)
+
+    def fields_changed_since(self, fields: tuple[FieldPath, ...], version: int) -> bool:
+        """Check whether any of the given field paths changed after a data version."""
+        return self._field_versions.changed_since(fields, version)
+
+    def _fire_match_event(
+        self,
+        plugin_event: str | None,
+        match_data: dict[str, Any],
+        previous_data: dict[str, Any],
+    ) -> None:
+        """Fire a bus event and notify event entities for the plugin event type."""
+        event_type = PLUGIN_EVENTS.get(plugin_event)
+        if event_type is None:
+            _LOGGER.debug("No match event for plugin event type: %s", plugin_event)
+            return
+        
+        team_data = match_data.get("TeamData", {})
+        current = match_data.get("MMRData", {}).get("current_playlist", {})
+        player_score = team_data.get("PlayersTeam", {}).get("score")
+        other_score = team_data.get("OtherTeam", {}).get("score")
+        
+        event_data: dict[str, Any] = {
+            "entry_id": self.entry.entry_id,
+            "username": self.username,
+            "platform": self.platform,
+            "uuid": self.uuid,
+            "playlist": current.get("name"),
+            "player_team_score": player_score,
+            "other_team_score": other_score,
+        }
+        
+        if event_type == EVENT_TYPE_GOAL:
+            event_data["scoring_team"] = self._scoring_team(team_data, previous_data.get("TeamData", {}))
+        elif event_type == EVENT_TYPE_MATCH_ENDED:
+            mmr = current.get("mmr")
+            previous_mmr = self._previous_playlist_mmr(current.get("name"), previous_data)
+            event_data["result"] = self.match_result_from_team_data(team_data)
+            event_data["mmr"] = mmr
+            event_data["mmr_delta"] = (
+                mmr - previous_mmr if mmr is not None and previous_mmr is not None else None
             )
-            _LOGGER.debug("Saved match data to config entry for persistence")
-        except Exception as e:
-            _LOGGER.warning("Failed to save match data to config entry: %s", e)
+            if (summary := self._add_to_history(event_data, team_data)) is None:
+                _LOGGER.debug("Repeated match end for %s, not firing %s again",
+                             self.username, BUS_EVENTS[event_type])
+                return
+            event_data["match_id"] = summary.get("match_id")
+        
+        _LOGGER.debug("Firing %s for %s: %s", BUS_EVENTS[event_type], self.username, event_data)
+        self.hass.bus.async_fire(BUS_EVENTS[event_type], event_data)
+        async_dispatcher_send(
+            self.hass, SIGNAL_MATCH_EVENT.format(self.entry.entry_id), event_type, event_data
+        )
+
+    def _add_to_history(
+        self, event_data: dict[str, Any], team_data: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """Record a compact summary of an ended match, linked to its shared match record.
+
+        Returns ``None`` for a repeated end of the match this player last finished.
+        """
+        summary = {
+            "ended": dt_util.utcnow().isoformat(),
+            "playlist": _intern(event_data["playlist"]),
+            "result": event_data["result"],
+            "player_team_score": event_data["player_team_score"],
+            "other_team_score": event_data["other_team_score"],
+            "mmr": event_data["mmr"],
+            "mmr_delta": event_data["mmr_delta"],
+        }
+        if (record := self._match_index.async_add_match(self, summary, team_data)) is not None:
+            # A repeated match end from this player maps to the record it already has
+            if record["id"] == self._last_match_id:
+                return None
+            self._last_match_id = record["id"]
+            summary["match_id"] = record["id"]
+        self.match_history.append(summary)
+        return summary
+
+    def memory_report(self) -> dict[str, Any]:
+        """Approximate memory held by this coordinator, for diagnostics."""
+        return {
+            "memory_budget": self.memory_budget,
+            "match_data_bytes": _deep_getsizeof(self._last_match_data),
+            "history_entries": len(self.match_history),
+            "history_limit": self.match_history.maxlen,
+            "history_bytes": _deep_getsizeof(self.match_history),
+            "tracked_fields": len(self._field_versions.changed),
+            "field_versions_bytes": _deep_getsizeof(vars(self._field_versions)),
+        }
+
+    @staticmethod
+    def _scoring_team(team_data: dict[str, Any], previous_team_data: dict[str, Any]) -> str | None:
+        """Work out which team scored by comparing against the previous scores."""
+        player_gain = team_data.get("PlayersTeam", {}).get("score", 0) - previous_team_data.get("PlayersTeam", {}).get("score", 0)
+        other_gain = team_data.get("OtherTeam", {}).get("score", 0) - previous_team_data.get("OtherTeam", {}).get("score", 0)
+        
+        if player_gain > 0 and other_gain <= 0:
+            return "player"
+        if other_gain > 0 and player_gain <= 0:
+            return "opponent"
+        return None
+
+    @staticmethod
+    def _previous_playlist_mmr(playlist: str | None, previous_data: dict[str, Any]) -> Any:
+        """Get the MMR a playlist had before this update."""
+        if not playlist:
+            return None
+        
+        mmr_data = previous_data.get("MMRData", {})
+        previous_rank = mmr_data.get("ranks", {}).get(playlist)
+        if previous_rank and previous_rank.get("mmr") is not None:
+            return previous_rank.get("mmr")
+        
+        previous_current = mmr_data.get("current_playlist", {})
+        if previous_current.get("name") == playlist:
+            return previous_current.get("mmr")
+        return None
+
+    @staticmethod
+    def match_result_from_team_data(team_data: dict[str, Any]) -> str | None:
+        """Get Win/Loss/Tie from team scores."""
+        if not team_data:
+            return None
+        
+        player_score = team_data.get("PlayersTeam", {}).get("score", 0)
+        other_score = team_data.get("OtherTeam", {}).get("score", 0)
+        
+        if player_score > other_score:
+            return RESULT_WIN
+        elif player_score < other_score:
+            return RESULT_LOSS
+        else:
+            return RESULT_TIE
+
+    def _save_match_data(self, match_data: dict[str, Any]) -> None:
+        """Save match data to the shared store for persistence."""
+        self._match_index.async_set_player_state(self.entry.entry_id, match_data)
+        _LOGGER.debug("Scheduled save of match data for %s", self.username)
+
+    def _migrate_match_data_from_entry(self) -> dict[str, Any]:
+        """Move match data kept in entry.data by older versions into the shared store."""
+        new_data = dict(self.entry.data)
+        match_data = new_data.pop("last_match_data")
+        self.hass.config_entries.async_update_entry(self.entry, data=new_data)
+        self._match_index.async_set_player_state(self.entry.entry_id, match_data)
+        _LOGGER.debug("Migrated match data for %s from config entry to storage", self.username)
+        return match_data
+
+    @property
+    def match_data(self) -> dict[str, Any]:
+        """Get the current match state."""
+        return self._last_match_data
 
     @property
     def player_data(self) -> dict[str, Any]:
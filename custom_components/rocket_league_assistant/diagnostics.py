@@ -0,0 +1,33 @@
+"""Diagnostics support for Rocket League Assistant."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_UUID, DATA_MATCH_INDEX, DOMAIN
+from .coordinator import RocketLeagueCoordinator
+
+TO_REDACT = {CONF_UUID, "uid", "last_match_data"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: RocketLeagueCoordinator = hass.data[DOMAIN][entry.entry_id]
+    match_index = hass.data.get(DATA_MATCH_INDEX)
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "memory": coordinator.memory_report(),
+        "data_version": coordinator.data_version,
+        "last_match_data": async_redact_data(coordinator.match_data, TO_REDACT),
+        "match_history": list(coordinator.match_history),
+        "party_stats": match_index.party_stats.get(entry.entry_id) if match_index else None,
+    }
@@ -0,0 +1,75 @@
+"""Event platform for Rocket League Assistant."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.event import EventEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, EVENT_TYPES, SIGNAL_MATCH_EVENT
+from .coordinator import RocketLeagueCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up Rocket League Assistant event entities."""
+    _LOGGER.debug("Setting up event entities for entry: %s", config_entry.title)
+
+    coordinator: RocketLeagueCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+
+    async_add_entities([RocketLeagueMatchEvent(coordinator, config_entry)])
+    _LOGGER.info("Successfully set up match event entity for %s (%s)",
+                coordinator.username, coordinator.platform)
+
+
+class RocketLeagueMatchEvent(EventEntity):
+    """Event entity for match lifecycle events."""
+
+    _attr_should_poll = False
+    _attr_event_types = EVENT_TYPES
+
+    def __init__(
+        self,
+        coordinator: RocketLeagueCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the match event entity."""
+        self.coordinator = coordinator
+        self.config_entry = config_entry
+        self._attr_name = f"{coordinator.username} Match Event"
+        self._attr_unique_id = f"{config_entry.entry_id}_match_event"
+        self._attr_icon = "mdi:car-sports"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=f"Rocket League Assistant - {coordinator.username} ({coordinator.platform.title()})",
+            manufacturer="Rocket League Assistant",
+            model=f"Player Stats - {coordinator.platform.title()}",
+        )
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to match events from the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_MATCH_EVENT.format(self.config_entry.entry_id),
+                self._handle_match_event,
+            )
+        )
+
+    @callback
+    def _handle_match_event(self, event_type: str, event_data: dict[str, Any]) -> None:
+        """Handle a match event from the coordinator."""
+        _LOGGER.debug("Match event %s for %s", event_type, self.coordinator.username)
+        self._trigger_event(event_type, event_data)
+        self.async_write_ha_state()
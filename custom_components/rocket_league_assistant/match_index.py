@@ -0,0 +1,209 @@
+"""Cross-player match correlation for Rocket League Assistant."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+from uuid import uuid4
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CORRELATION_WINDOW,
+    DOMAIN,
+    MATCH_RECORD_LIMIT,
+    RESULT_WIN,
+    SIGNAL_PARTY_UPDATE,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import RocketLeagueCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = f"{DOMAIN}.matches"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+def _side_key(team: dict[str, Any]) -> str:
+    """Identify a team in a match by its final score and color."""
+    color = team.get("color") or {}
+    return f"{team.get('score')}|{color.get('r')},{color.get('g')},{color.get('b')}"
+
+
+class MatchIndex:
+    """Merge payloads from configured players in the same match into one record.
+
+    Payloads are matched on playlist, both teams' scores and colors, and
+    arrival within ``CORRELATION_WINDOW`` of each other. Teammates land on
+    the same side of the record, opponents on the other side.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the match index."""
+        self.hass = hass
+        self._store: Store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self.records: deque[dict[str, Any]] = deque(maxlen=MATCH_RECORD_LIMIT)
+        self.party_stats: dict[str, dict[str, Any]] = {}
+        # Each player's current match state, persisted here instead of in entry.data
+        self.player_state: dict[str, dict[str, Any]] = {}
+        # Records still open for correlation, with their arrival time
+        self._recent: list[tuple[datetime, dict[str, Any]]] = []
+        self._load_task: asyncio.Task | None = None
+
+    async def async_load(self) -> None:
+        """Load stored match records, once, however many entries wait on it."""
+        if self._load_task is None:
+            self._load_task = self.hass.async_create_task(self._async_load())
+        await self._load_task
+
+    async def _async_load(self) -> None:
+        """Load stored match records from storage."""
+        if (stored := await self._store.async_load()) is None:
+            _LOGGER.debug("No stored match records found")
+            return
+        self.records.extend(stored.get("records", []))
+        self.party_stats = stored.get("party_stats", {})
+        self.player_state = stored.get("player_state", {})
+        _LOGGER.debug("Loaded %d match records", len(self.records))
+
+    async def async_unload(self) -> None:
+        """Write any pending changes."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "records": list(self.records),
+            "party_stats": self.party_stats,
+            "player_state": self.player_state,
+        }
+
+    @callback
+    def async_set_player_state(self, entry_id: str, match_data: dict[str, Any]) -> None:
+        """Store a player's match state.
+
+        Saves are delayed, so the payloads of everyone in a match share one write.
+        """
+        self.player_state[entry_id] = match_data
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_remove_player(self, entry_id: str) -> None:
+        """Forget a removed player's state and stats."""
+        self.player_state.pop(entry_id, None)
+        self.party_stats.pop(entry_id, None)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_add_match(
+        self,
+        coordinator: RocketLeagueCoordinator,
+        summary: dict[str, Any],
+        team_data: dict[str, Any],
+    ) -> dict[str, Any] | None:
+        """Add an ended match for a player and return the shared record it belongs to.
+
+        Returns ``None`` when the two teams can't be told apart (tied scores
+        and no colors), since teammates and opponents would look the same. A
+        repeated match end from the same player returns the record it is
+        already in, unchanged.
+        """
+        now = dt_util.utcnow()
+        entry_id = coordinator.entry.entry_id
+        player_side = _side_key(team_data.get("PlayersTeam", {}))
+        other_side = _side_key(team_data.get("OtherTeam", {}))
+        if player_side == other_side:
+            _LOGGER.debug("Teams indistinguishable for %s, not correlating match", coordinator.username)
+            return None
+
+        cutoff = now - timedelta(seconds=CORRELATION_WINDOW)
+        self._recent = [(arrived, record) for arrived, record in self._recent if arrived >= cutoff]
+
+        candidates = [
+            record
+            for _, record in self._recent
+            if record["playlist"] == summary["playlist"]
+            and record["sides"].keys() == {player_side, other_side}
+        ]
+        for record in candidates:
+            if entry_id in record["players"]:
+                _LOGGER.debug("Repeated match end from %s, keeping match record %s",
+                             coordinator.username, record["id"])
+                return record
+
+        record = candidates[0] if candidates else None
+        if record is None:
+            record = {
+                "id": uuid4().hex,
+                "ended": summary["ended"],
+                "playlist": summary["playlist"],
+                "sides": {
+                    player_side: self._new_side(team_data.get("PlayersTeam", {}), summary["result"]),
+                    other_side: self._new_side(team_data.get("OtherTeam", {}), None),
+                },
+                "players": {},
+            }
+            self.records.append(record)
+            self._recent.append((now, record))
+            _LOGGER.debug("Created match record %s for %s", record["id"], coordinator.username)
+        else:
+            _LOGGER.debug("Correlated %s into match record %s", coordinator.username, record["id"])
+
+        side = record["sides"][player_side]
+        if side["result"] is None:
+            side["result"] = summary["result"]
+        side["players"].append(entry_id)
+        if summary["mmr_delta"] is not None:
+            side["combined_mmr_delta"] = (side["combined_mmr_delta"] or 0) + summary["mmr_delta"]
+        record["players"][entry_id] = {
+            "username": coordinator.username,
+            "side": player_side,
+            "mmr": summary["mmr"],
+            "mmr_delta": summary["mmr_delta"],
+        }
+
+        self._update_party_stats(record, side)
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        return record
+
+    @staticmethod
+    def _new_side(team: dict[str, Any], result: str | None) -> dict[str, Any]:
+        """Create an empty side of a match record."""
+        return {
+            "score": team.get("score"),
+            "color": team.get("color"),
+            "result": result,
+            "players": [],
+            "combined_mmr_delta": None,
+        }
+
+    @callback
+    def _update_party_stats(self, record: dict[str, Any], side: dict[str, Any]) -> None:
+        """Update party stats for the side a player just joined, once for the whole side."""
+        players = side["players"]
+        if len(players) < 2:
+            return
+
+        # The second player makes this a party match for both; later ones only count themselves
+        newly_counted = players if len(players) == 2 else players[-1:]
+        won = side["result"] == RESULT_WIN
+        for entry_id in newly_counted:
+            stats = self.party_stats.setdefault(entry_id, {"matches": 0, "wins": 0})
+            stats["matches"] += 1
+            stats["wins"] += int(won)
+
+        for entry_id in players:
+            stats = self.party_stats[entry_id]
+            stats["win_rate"] = round(stats["wins"] / stats["matches"] * 100, 1)
+            stats["last_match_id"] = record["id"]
+            stats["last_combined_mmr_delta"] = side["combined_mmr_delta"]
+            stats["last_party"] = [record["players"][member]["username"] for member in players]
+            async_dispatcher_send(self.hass, SIGNAL_PARTY_UPDATE.format(entry_id))
@@ -11,13 +11,15 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, PLAYLISTS, RANK_TIERS
-from .coordinator import RocketLeagueCoordinator
+from .const import DATA_MATCH_INDEX, DOMAIN, PLAYLISTS, RANK_TIERS, SIGNAL_PARTY_UPDATE
+from .coordinator import FieldPath, RocketLeagueCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -92,6 +94,8 @@ async def async_setup_entry(
         LastMatchResultSensor(coordinator, config_entry),
         PlayerTeamScoreSensor(coordinator, config_entry),
         OpponentTeamScoreSensor(coordinator, config_entry),
+        PartyWinRateSensor(coordinator, config_entry),
+        PartyMmrChangeSensor(coordinator, config_entry),
     ])
     
     _LOGGER.debug("Created %d entities for user %s", len(entities), coordinator.username)
@@ -104,6 +108,9 @@ async def async_setup_entry(
 class RocketLeagueBaseSensor(CoordinatorEntity[RocketLeagueCoordinator], SensorEntity):
     """Base class for Rocket League sensors."""
 
+    # Coordinator fields this sensor reads; updates that don't touch them are skipped
+    _data_fields: tuple[FieldPath, ...] = ()
+
     def __init__(
         self,
         coordinator: RocketLeagueCoordinator,
@@ -112,6 +119,9 @@ class RocketLeagueBaseSensor(CoordinatorEntity[RocketLeagueCoordinator], SensorE
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.config_entry = config_entry
+        self._seen_version = coordinator.data_version
+        self._attributes: dict[str, Any] | None = None
+        self._attributes_version: int | None = None
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, config_entry.entry_id)},
             name=f"Rocket League Assistant - {coordinator.username} ({coordinator.platform.title()})",
@@ -119,6 +129,28 @@ class RocketLeagueBaseSensor(CoordinatorEntity[RocketLeagueCoordinator], SensorE
             model=f"Player Stats - {coordinator.platform.title()}",
         )
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        if self._data_fields and not self.coordinator.fields_changed_since(
+            self._data_fields, self._seen_version
+        ):
+            return
+        self._seen_version = self.coordinator.data_version
+        super()._handle_coordinator_update()
+
+    def _build_extra_state_attributes(self) -> dict[str, Any] | None:
+        """Build additional state attributes."""
+        return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return additional state attributes, rebuilt only when this sensor's fields change."""
+        if self._attributes_version != self._seen_version:
+            self._attributes = self._build_extra_state_attributes()
+            self._attributes_version = self._seen_version
+        return self._attributes
+
 
 class RocketLeagueRankSensor(RocketLeagueBaseSensor):
     """Sensor for individual rank attributes."""
@@ -139,6 +171,7 @@ class RocketLeagueRankSensor(RocketLeagueBaseSensor):
         self.attribute = attribute
         self._attr_name = f"{coordinator.username} {PLAYLISTS.get(playlist, playlist)} {attribute_name}"
         self._attr_unique_id = f"{config_entry.entry_id}_{playlist}_{attribute}"
+        self._data_fields = (("MMRData", "ranks", playlist),)
         self._attr_device_class = device_class
         self._attr_state_class = state_class
         
@@ -154,11 +187,6 @@ class RocketLeagueRankSensor(RocketLeagueBaseSensor):
         elif attribute == "rank_name":
             self._attr_icon = "mdi:crown"
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        super()._handle_coordinator_update()
-
     @property
     def native_value(self) -> Any:
         """Return the state of the sensor."""
@@ -172,9 +200,8 @@ class RocketLeagueRankSensor(RocketLeagueBaseSensor):
         # Return raw value without conversion
         return value
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build additional state attributes."""
         ranks = self.coordinator.ranks
         if self.playlist not in ranks:
             return {}
@@ -192,6 +219,8 @@ class RocketLeagueRankSensor(RocketLeagueBaseSensor):
 class CurrentPlaylistSensor(RocketLeagueBaseSensor):
     """Sensor for the current playlist being played."""
 
+    _data_fields = (("MMRData", "current_playlist"),)
+
     def __init__(
         self,
         coordinator: RocketLeagueCoordinator,
@@ -210,9 +239,8 @@ class CurrentPlaylistSensor(RocketLeagueBaseSensor):
         playlist_name = current.get("name")
         return PLAYLISTS.get(playlist_name, playlist_name) if playlist_name else None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build additional state attributes."""
         current = self.coordinator.current_playlist
         return {
             "playlist_id": current.get("id"),
@@ -230,6 +258,8 @@ class CurrentPlaylistSensor(RocketLeagueBaseSensor):
 class LastMatchResultSensor(RocketLeagueBaseSensor):
     """Sensor for the last match result."""
 
+    _data_fields = (("TeamData",),)
+
     def __init__(
         self,
         coordinator: RocketLeagueCoordinator,
@@ -244,23 +274,10 @@ class LastMatchResultSensor(RocketLeagueBaseSensor):
     @property
     def native_value(self) -> str | None:
         """Return the match result."""
-        team_data = self.coordinator.team_data
-        if not team_data:
-            return None
-            
-        player_score = team_data.get("PlayersTeam", {}).get("score", 0)
-        other_score = team_data.get("OtherTeam", {}).get("score", 0)
-        
-        if player_score > other_score:
-            return "Win"
-        elif player_score < other_score:
-            return "Loss"
-        else:
-            return "Tie"
+        return self.coordinator.match_result_from_team_data(self.coordinator.team_data)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
+    def _build_extra_state_attributes(self) -> dict[str, Any]:
+        """Build additional state attributes."""
         team_data = self.coordinator.team_data
         if not team_data:
             return {}
@@ -278,6 +295,8 @@ class LastMatchResultSensor(RocketLeagueBaseSensor):
 class PlayerTeamScoreSensor(RocketLeagueBaseSensor):
     """Sensor for player team score."""
 
+    _data_fields = (("TeamData",),)
+
     def __init__(
         self,
         coordinator: RocketLeagueCoordinator,
@@ -300,6 +319,8 @@ class PlayerTeamScoreSensor(RocketLeagueBaseSensor):
 class OpponentTeamScoreSensor(RocketLeagueBaseSensor):
     """Sensor for opponent team score."""
 
+    _data_fields = (("TeamData",),)
+
     def __init__(
         self,
         coordinator: RocketLeagueCoordinator,
@@ -316,4 +337,92 @@ class OpponentTeamScoreSensor(RocketLeagueBaseSensor):
     def native_value(self) -> int | None:
         """Return the opponent team score."""
         team_data = self.coordinator.team_data
-        return team_data.get("OtherTeam", {}).get("score") if team_data else None
\ No newline at end of file
+        return team_data.get("OtherTeam", {}).get("score") if team_data else None
+
+
+class RocketLeaguePartySensor(RocketLeagueBaseSensor):
+    """Base class for sensors computed by the shared match index."""
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to party stat updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PARTY_UPDATE.format(self.config_entry.entry_id),
+                self.async_write_ha_state,
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Party stats are pushed by the match index, not the coordinator."""
+
+    @property
+    def party_stats(self) -> dict[str, Any]:
+        """Get this player's party stats from the match index."""
+        match_index = self.hass.data.get(DATA_MATCH_INDEX)
+        if match_index is None:
+            return {}
+        return match_index.party_stats.get(self.config_entry.entry_id, {})
+
+
+class PartyWinRateSensor(RocketLeaguePartySensor):
+    """Sensor for the win rate of matches played with other configured players."""
+
+    def __init__(
+        self,
+        coordinator: RocketLeagueCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the party win rate sensor."""
+        super().__init__(coordinator, config_entry)
+        self._attr_name = f"{coordinator.username} Party Win Rate"
+        self._attr_unique_id = f"{config_entry.entry_id}_party_win_rate"
+        self._attr_icon = "mdi:account-group"
+        self._attr_native_unit_of_measurement = PERCENTAGE
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the party win rate."""
+        return self.party_stats.get("win_rate")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        stats = self.party_stats
+        return {
+            "party_matches": stats.get("matches", 0),
+            "party_wins": stats.get("wins", 0),
+            "last_party": stats.get("last_party"),
+        }
+
+
+class PartyMmrChangeSensor(RocketLeaguePartySensor):
+    """Sensor for the combined MMR change of the party in its last shared match."""
+
+    def __init__(
+        self,
+        coordinator: RocketLeagueCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the party MMR change sensor."""
+        super().__init__(coordinator, config_entry)
+        self._attr_name = f"{coordinator.username} Party MMR Change"
+        self._attr_unique_id = f"{config_entry.entry_id}_party_mmr_change"
+        self._attr_icon = "mdi:swap-vertical"
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the combined MMR change of the last party match."""
+        return self.party_stats.get("last_combined_mmr_delta")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return additional state attributes."""
+        stats = self.party_stats
+        return {
+            "match_id": stats.get("last_match_id"),
+            "last_party": stats.get("last_party"),
+        }
@@ -9,7 +9,7 @@ import voluptuous as vol
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
-from .const import DOMAIN
+from .const import DOMAIN, PAYLOAD_DELTA
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -21,6 +21,7 @@ UPDATE_MATCH_DATA_SCHEMA = vol.Schema(
         vol.Optional("TeamData"): dict,
         vol.Optional("MMRData"): dict,
         vol.Optional("json_data"): dict,  # Accept full JSON payload
+        vol.Optional(PAYLOAD_DELTA): cv.boolean,  # Merge into current state instead of replacing it
     }
 )
 
@@ -38,6 +39,12 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             # Full JSON payload provided
             webhook_data = call.data["json_data"]
             _LOGGER.debug("Using full JSON payload from service call")
+        elif call.data.get(PAYLOAD_DELTA):
+            # Partial update, only pass on the fields that were provided
+            webhook_data = {
+                key: call.data[key] for key in ("data", "TeamData", "MMRData") if key in call.data
+            }
+            _LOGGER.debug("Using individual fields from service call as a delta")
         else:
             # Individual fields provided (backward compatibility)
             webhook_data = {
@@ -47,6 +54,9 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             }
             _LOGGER.debug("Using individual fields from service call")
         
+        if call.data.get(PAYLOAD_DELTA):
+            webhook_data = {**webhook_data, PAYLOAD_DELTA: True}
+        
         _LOGGER.debug("Webhook data to process: %s", webhook_data)
         _LOGGER.debug("Available coordinators: %s", list(hass.data[DOMAIN].keys()) if DOMAIN in hass.data else "None")
         
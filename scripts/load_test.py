@@ -0,0 +1,463 @@
+"""Load generator that stands in for the Rocket League Assistant BakkesMod plugin.
+
+Sends realistic match payloads for N simulated players at a fixed rate and
+reports end-to-end latency, rejected/dropped payloads and event loop lag.
+
+Targets:
+    service   POST to a running Home Assistant's REST API service endpoint
+              (blocking, so latency covers the whole ingestion path)
+    webhook   POST to a Home Assistant webhook, as the plugin does
+              (returns once the webhook is accepted)
+    inprocess Start a bare Home Assistant core in this process, configure the
+              simulated players through the config flow and call the service
+              handler directly
+
+Examples:
+    python scripts/load_test.py service --url http://localhost:8123 --token TOKEN --players 20 --rate 10 50 100
+    python scripts/load_test.py webhook --url http://localhost:8123 --token TOKEN --webhook-id rocket_league --players 8 --rate 25
+    python scripts/load_test.py inprocess --players 200 --rate 100 500 1000 --duration 20
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import logging
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Load const.py on its own so the HTTP targets don't need Home Assistant installed
+_const_spec = importlib.util.spec_from_file_location(
+    "rocket_league_assistant_const",
+    REPO_ROOT / "custom_components" / "rocket_league_assistant" / "const.py",
+)
+const = importlib.util.module_from_spec(_const_spec)
+_const_spec.loader.exec_module(const)
+
+_LOGGER = logging.getLogger("rocket_league_load_test")
+
+SERVICE_UPDATE_MATCH_DATA = "update_match_data"
+BASE_UUID = 76561190000000000
+LAG_INTERVAL = 0.05
+PROBE_TIMEOUT = 10.0
+
+# Entities each in-process player should end up with: five rank sensors per
+# playlist, four match sensors, two party sensors and the match event entity
+ENTITIES_PER_PLAYER = len(const.PLAYLISTS) * 5 + 4 + 2 + 1
+
+BLUE = {"r": 24, "g": 115, "b": 255}
+ORANGE = {"r": 194, "g": 100, "b": 24}
+
+
+class SimulatedPlayer:
+    """A fake plugin instance that walks through matches and emits payloads."""
+
+    def __init__(self, index: int, rng: random.Random) -> None:
+        """Initialize the simulated player."""
+        self.rng = rng
+        self.name = f"LoadTest{index:04d}"
+        self.uuid = str(BASE_UUID + index)
+        self.uid = f"Steam|{self.uuid}|0"
+        self.ranks = {
+            playlist: self._random_rank() for playlist in const.PLAYLISTS
+        }
+        self._playlist = "Doubles"
+        self._scores = [0, 0]
+        self._goals_left = 0
+        self._in_match = False
+
+    def _random_rank(self) -> dict[str, Any]:
+        """Build a plausible rank entry."""
+        tier = self.rng.randint(1, len(const.RANK_TIERS) - 1)
+        division = self.rng.randint(0, 3)
+        return {
+            "mmr": 100 + tier * 60 + division * 15 + self.rng.randint(0, 14),
+            "tier": tier,
+            "division": division,
+            "matches_played": self.rng.randint(0, 500),
+            "rank_name": f"{const.RANK_TIERS[tier]} Div {division + 1}",
+            "is_synced": True,
+        }
+
+    def next_payload(self) -> dict[str, Any]:
+        """Advance the simulated match and return the next plugin payload."""
+        if not self._in_match:
+            self._playlist = self.rng.choice(list(const.PLAYLISTS))
+            self._scores = [0, 0]
+            self._goals_left = self.rng.randint(1, 8)
+            self._in_match = True
+            event = const.PLUGIN_EVENT_MATCH_STARTED
+        elif self._goals_left > 0:
+            self._scores[self.rng.randint(0, 1)] += 1
+            self._goals_left -= 1
+            event = const.PLUGIN_EVENT_GOAL_SCORED
+        else:
+            if self._scores[0] == self._scores[1]:
+                self._scores[self.rng.randint(0, 1)] += 1
+            rank = self.ranks[self._playlist]
+            rank["mmr"] += self.rng.randint(7, 12) * (1 if self._scores[0] > self._scores[1] else -1)
+            rank["matches_played"] += 1
+            self._in_match = False
+            event = const.PLUGIN_EVENT_MATCH_ENDED
+
+        current = dict(self.ranks[self._playlist])
+        current["id"] = list(const.PLAYLISTS).index(self._playlist) + 10
+        current["name"] = self._playlist
+        return {
+            "data": event,
+            "TeamData": {
+                "PlayersTeam": {"color": BLUE, "score": self._scores[0]},
+                "OtherTeam": {"color": ORANGE, "score": self._scores[1]},
+            },
+            "MMRData": {
+                "player_data": {"name": self.name, "uid": self.uid},
+                "current_playlist": current,
+                "ranks": {playlist: dict(rank) for playlist, rank in self.ranks.items()},
+            },
+        }
+
+
+@dataclass
+class RunStats:
+    """Results of a single run at one rate."""
+
+    rate: float
+    sent: int = 0
+    ok: int = 0
+    rejected: int = 0
+    dropped: int = 0
+    latencies: list[float] = field(default_factory=list)
+    loop_lag: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def report(self) -> str:
+        """Format the run results."""
+        lines = [
+            f"rate target {self.rate:.1f}/s, achieved {self.sent / self.elapsed if self.elapsed else 0:.1f}/s over {self.elapsed:.1f}s",
+            f"  sent {self.sent}, ok {self.ok}, rejected {self.rejected}, dropped {self.dropped}",
+        ]
+        if self.latencies:
+            lines.append(
+                "  latency ms: p50 {:.2f}  p95 {:.2f}  p99 {:.2f}  max {:.2f}".format(
+                    *(value * 1000 for value in (
+                        _percentile(self.latencies, 50),
+                        _percentile(self.latencies, 95),
+                        _percentile(self.latencies, 99),
+                        max(self.latencies),
+                    ))
+                )
+            )
+        if self.loop_lag:
+            lines.append(
+                "  event loop lag ms: mean {:.2f}  p99 {:.2f}  max {:.2f}".format(
+                    statistics.fmean(self.loop_lag) * 1000,
+                    _percentile(self.loop_lag, 99) * 1000,
+                    max(self.loop_lag) * 1000,
+                )
+            )
+        return "\n".join(lines)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _measure_loop_lag(stats: RunStats, stop: asyncio.Event) -> None:
+    """Record how late the event loop wakes a periodic sleeper."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + LAG_INTERVAL
+        await asyncio.sleep(LAG_INTERVAL)
+        stats.loop_lag.append(max(0.0, loop.time() - expected))
+
+
+async def run_at_rate(
+    send: Callable[[dict[str, Any]], Awaitable[bool]],
+    players: list[SimulatedPlayer],
+    rate: float,
+    duration: float,
+    timeout: float,
+) -> RunStats:
+    """Send payloads round-robin across players at the given rate."""
+    stats = RunStats(rate=rate)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(_measure_loop_lag(stats, stop))
+    pending: set[asyncio.Task] = set()
+
+    async def _send_one(payload: dict[str, Any]) -> None:
+        started = time.perf_counter()
+        try:
+            accepted = await asyncio.wait_for(send(payload), timeout)
+        except asyncio.TimeoutError:
+            stats.dropped += 1
+            return
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Payload rejected: %s", err)
+            stats.rejected += 1
+            return
+        if accepted:
+            stats.ok += 1
+            stats.latencies.append(time.perf_counter() - started)
+        else:
+            stats.rejected += 1
+
+    start = loop.time()
+    interval = 1 / rate
+    next_send = start
+    index = 0
+    while loop.time() - start < duration:
+        payload = players[index % len(players)].next_payload()
+        index += 1
+        task = asyncio.create_task(_send_one(payload))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        stats.sent += 1
+        next_send += interval
+        await asyncio.sleep(max(0.0, next_send - loop.time()))
+
+    if pending:
+        await asyncio.wait(pending)
+    stats.elapsed = loop.time() - start
+    stop.set()
+    await lag_task
+    return stats
+
+
+async def _run(args: argparse.Namespace) -> None:
+    """Set up the target and run each requested rate."""
+    rng = random.Random(args.seed)
+    players = [SimulatedPlayer(index, rng) for index in range(args.players)]
+
+    if args.target == "inprocess":
+        target = InProcessTarget(players)
+    else:
+        target = HttpTarget(args, players)
+
+    await target.async_start()
+    try:
+        for rate in args.rate:
+            stats = await run_at_rate(target.send, players, rate, args.duration, args.timeout)
+            print(stats.report(), flush=True)
+    finally:
+        await target.async_stop()
+
+
+class HttpTarget:
+    """Send payloads to a running Home Assistant over HTTP."""
+
+    def __init__(self, args: argparse.Namespace, players: list[SimulatedPlayer]) -> None:
+        """Initialize the HTTP target."""
+        self.args = args
+        self.players = players
+        self._session = None
+        base = args.url.rstrip("/")
+        self._states_url = f"{base}/api/states"
+        if args.target == "webhook":
+            self._url = f"{base}/api/webhook/{args.webhook_id}"
+        else:
+            self._url = f"{base}/api/services/{const.DOMAIN}/{SERVICE_UPDATE_MATCH_DATA}"
+
+    async def async_start(self) -> None:
+        """Open the HTTP session and check the simulated players are configured."""
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            headers={"Authorization": f"Bearer {self.args.token}"},
+            connector=aiohttp.TCPConnector(limit=self.args.connections),
+        )
+        # Unmatched UIDs and unknown webhook IDs still get a 2xx response, so
+        # make sure payloads actually reach entities before measuring anything
+        await self._check_entities()
+        await self._check_ingestion()
+
+    @staticmethod
+    def _event_entity_id(player: SimulatedPlayer) -> str:
+        """Entity ID of a simulated player's match event entity."""
+        return f"event.{player.name.lower()}_match_event"
+
+    async def _check_entities(self) -> None:
+        """Abort unless every simulated player has a configured entry."""
+        async with self._session.get(self._states_url) as response:
+            response.raise_for_status()
+            states = await response.json()
+        entity_ids = {state["entity_id"] for state in states}
+        missing = [
+            player.name for player in self.players if self._event_entity_id(player) not in entity_ids
+        ]
+        if missing:
+            raise RuntimeError(
+                f"{len(missing)}/{len(self.players)} simulated players have no entities "
+                f"(e.g. {', '.join(missing[:3])}); configure steam entries with UUIDs "
+                f"{self.players[0].uuid} to {self.players[-1].uuid}"
+            )
+
+    async def _get_state(self, entity_id: str) -> str | None:
+        """Get an entity's current state."""
+        async with self._session.get(f"{self._states_url}/{entity_id}") as response:
+            response.raise_for_status()
+            return (await response.json())["state"]
+
+    async def _check_ingestion(self) -> None:
+        """Abort unless a probe payload updates the first player's match event entity."""
+        player = self.players[0]
+        entity_id = self._event_entity_id(player)
+        before = await self._get_state(entity_id)
+        if not await self.send(player.next_payload()):
+            raise RuntimeError(f"Probe payload rejected by {self._url}")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + PROBE_TIMEOUT
+        while loop.time() < deadline:
+            if await self._get_state(entity_id) != before:
+                print(f"Probe payload reached {entity_id}", flush=True)
+                return
+            await asyncio.sleep(0.25)
+        raise RuntimeError(
+            f"Probe payload to {self._url} didn't update {entity_id} within {PROBE_TIMEOUT:.0f}s"
+        )
+
+    async def async_stop(self) -> None:
+        """Close the HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+
+    async def send(self, payload: dict[str, Any]) -> bool:
+        """Post a payload and report whether it was accepted."""
+        body = payload if self.args.target == "webhook" else {"json_data": payload}
+        async with self._session.post(self._url, json=body) as response:
+            await response.read()
+            return response.status < 300
+
+
+class InProcessTarget:
+    """Run a bare Home Assistant core in this process and call the service directly."""
+
+    def __init__(self, players: list[SimulatedPlayer]) -> None:
+        """Initialize the in-process target."""
+        self.players = players
+        self.hass = None
+        self._config_dir: str | None = None
+
+    async def async_start(self) -> None:
+        """Start Home Assistant and configure one entry per simulated player."""
+        from homeassistant import bootstrap, config_entries, loader
+        from homeassistant.core import HomeAssistant
+        from homeassistant.helpers import (
+            area_registry as ar,
+            category_registry as cr,
+            device_registry as dr,
+            entity_registry as er,
+            floor_registry as fr,
+            issue_registry as ir,
+            label_registry as lr,
+            restore_state as rs,
+        )
+        from homeassistant.setup import async_setup_component
+
+        self._config_dir = tempfile.mkdtemp(prefix="rla_load_test_")
+        (Path(self._config_dir) / "custom_components").symlink_to(REPO_ROOT / "custom_components")
+        sys.path.insert(0, self._config_dir)
+
+        self.hass = HomeAssistant(self._config_dir)
+        loader.async_setup(self.hass)
+        self.hass.config_entries = config_entries.ConfigEntries(self.hass, {})
+        await self.hass.config_entries.async_initialize()
+
+        # Load the registries bootstrap normally loads, as HA's own test harness
+        # does, so entity platforms can register entities and write states
+        await ar.async_load(self.hass)
+        await cr.async_load(self.hass)
+        await dr.async_load(self.hass)
+        await er.async_load(self.hass)
+        await fr.async_load(self.hass)
+        await ir.async_load(self.hass)
+        await lr.async_load(self.hass)
+        await rs.async_load(self.hass)
+        self.hass.data[bootstrap.DATA_REGISTRIES_LOADED] = None
+
+        await async_setup_component(self.hass, const.DOMAIN, {})
+
+        for player in self.players:
+            await self.hass.config_entries.flow.async_init(
+                const.DOMAIN,
+                context={"source": config_entries.SOURCE_USER},
+                data={
+                    "name": player.name,
+                    "username": player.name,
+                    "platform": "steam",
+                    "uuid": player.uuid,
+                },
+            )
+        await self.hass.async_block_till_done()
+
+        entries = self.hass.config_entries.async_entries(const.DOMAIN)
+        expected = len(self.players) * ENTITIES_PER_PLAYER
+        entity_registry = er.async_get(self.hass)
+        registered = [
+            registry_entry.entity_id
+            for entry in entries
+            for registry_entry in er.async_entries_for_config_entry(entity_registry, entry.entry_id)
+        ]
+        with_state = sum(1 for entity_id in registered if self.hass.states.get(entity_id) is not None)
+        if len(entries) != len(self.players) or len(registered) != expected or with_state != expected:
+            raise RuntimeError(
+                f"In-process setup incomplete: {len(entries)}/{len(self.players)} entries, "
+                f"{len(registered)}/{expected} registered entities, {with_state}/{expected} entity states"
+            )
+        print(f"Configured {len(entries)} in-process players with {len(registered)} entities", flush=True)
+
+    async def async_stop(self) -> None:
+        """Stop Home Assistant and clean up the config directory."""
+        if self.hass is not None:
+            await self.hass.async_stop(force=True)
+        if self._config_dir is not None:
+            shutil.rmtree(self._config_dir, ignore_errors=True)
+
+    async def send(self, payload: dict[str, Any]) -> bool:
+        """Call the update service and wait for it to finish."""
+        await self.hass.services.async_call(
+            const.DOMAIN, SERVICE_UPDATE_MATCH_DATA, {"json_data": payload}, blocking=True
+        )
+        return True
+
+
+def main() -> None:
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("target", choices=["service", "webhook", "inprocess"])
+    parser.add_argument("--url", default="http://localhost:8123", help="Home Assistant base URL")
+    parser.add_argument("--token", help="Long-lived access token (service and webhook targets)")
+    parser.add_argument("--webhook-id", help="Webhook ID (webhook target)")
+    parser.add_argument("--players", type=int, default=4, help="Number of simulated players")
+    parser.add_argument("--rate", type=float, nargs="+", default=[10.0], help="Payloads per second; several values run one after another")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run at each rate")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Seconds before a payload counts as dropped")
+    parser.add_argument("--connections", type=int, default=100, help="Maximum concurrent HTTP connections")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for payload generation")
+    parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    args = parser.parse_args()
+
+    if args.target == "webhook" and not args.webhook_id:
+        parser.error("--webhook-id is required for the webhook target")
+    if args.target != "inprocess" and not args.token:
+        parser.error("--token is required for the service and webhook targets")
+
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Tests for the Rocket League Assistant coordinator helpers."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.rocket_league_assistant.coordinator import (  # noqa: E402
+    FieldVersions,
+    _diff_paths,
+    _merge_delta,
+)
+
+STATE = {
+    "data": "goalScored",
+    "TeamData": {"PlayersTeam": {"score": 1}, "OtherTeam": {"score": 0}},
+    "MMRData": {
+        "current_playlist": {"name": "Doubles", "mmr": 900},
+        "ranks": {"Doubles": {"mmr": 900}, "Standard": {"mmr": 800}},
+    },
+}
+
+DOUBLES = (("MMRData", "ranks", "Doubles"),)
+STANDARD = (("MMRData", "ranks", "Standard"),)
+CURRENT_PLAYLIST = (("MMRData", "current_playlist"),)
+TEAM_DATA = (("TeamData",),)
+
+
+def test_merge_delta_changes_only_given_fields() -> None:
+    """A delta only changes the leaves it carries and shares untouched branches."""
+    merged, changed = _merge_delta(STATE, {"MMRData": {"ranks": {"Doubles": {"mmr": 909}}}})
+
+    assert changed == [("MMRData", "ranks", "Doubles", "mmr")]
+    assert merged["MMRData"]["ranks"]["Doubles"]["mmr"] == 909
+    assert merged["MMRData"]["ranks"]["Standard"] is STATE["MMRData"]["ranks"]["Standard"]
+    assert merged["TeamData"] is STATE["TeamData"]
+    assert STATE["MMRData"]["ranks"]["Doubles"]["mmr"] == 900
+
+
+def test_merge_delta_null_deletes_key() -> None:
+    """A null in a delta removes the key instead of storing None."""
+    merged, changed = _merge_delta(STATE, {"TeamData": None, "MMRData": {"ranks": None}, "missing": None})
+
+    assert "TeamData" not in merged
+    assert "ranks" not in merged["MMRData"]
+    assert sorted(changed) == [("MMRData", "ranks"), ("TeamData",)]
+
+
+def test_merge_delta_without_changes() -> None:
+    """A delta repeating the current values changes nothing."""
+    _, changed = _merge_delta(STATE, {"TeamData": {"PlayersTeam": {"score": 1}}})
+
+    assert changed == []
+
+
+def test_diff_paths() -> None:
+    """A full payload reports changed, added and removed paths."""
+    new = {
+        "data": "goalScored",
+        "TeamData": {"PlayersTeam": {"score": 2}, "OtherTeam": {"score": 0}},
+        "MMRData": {"current_playlist": {"name": "Doubles", "mmr": 900}},
+    }
+
+    assert sorted(_diff_paths(STATE, new)) == [
+        ("MMRData", "ranks"),
+        ("TeamData", "PlayersTeam", "score"),
+    ]
+    assert _diff_paths(STATE, STATE) == []
+
+
+def test_field_versions_sibling_isolation() -> None:
+    """A change to one playlist doesn't mark other playlists or sections as changed."""
+    versions = FieldVersions()
+    versions.record([("MMRData", "ranks", "Doubles", "mmr")])
+
+    assert versions.changed_since(DOUBLES, 0)
+    assert not versions.changed_since(STANDARD, 0)
+    assert not versions.changed_since(CURRENT_PLAYLIST, 0)
+    assert not versions.changed_since(TEAM_DATA, 0)
+    assert not versions.changed_since(DOUBLES, versions.version)
+
+
+def test_field_versions_ancestor_deletion() -> None:
+    """Dropping a whole section counts as a change for every field below it."""
+    versions = FieldVersions()
+    versions.record([("MMRData", "ranks")])
+
+    assert versions.changed_since(DOUBLES, 0)
+    assert versions.changed_since(STANDARD, 0)
+    assert not versions.changed_since(CURRENT_PLAYLIST, 0)
+    assert not versions.changed_since(TEAM_DATA, 0)
+
+
+def test_field_versions_changes_below_field() -> None:
+    """A change below a field's path counts as a change to that field."""
+    versions = FieldVersions()
+    versions.record([("TeamData", "OtherTeam", "score")])
+
+    assert versions.changed_since(TEAM_DATA, 0)
+    assert not versions.changed_since(DOUBLES, 0)